@@ -2,39 +2,101 @@
 # -*- coding: utf-8 -*-
 
 import os
+import io
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
 import pdfplumber
 from tqdm import tqdm
 
+# 页码与页眉页脚
+_RE_PAGE_MARK = re.compile(r"^--- 第 \d+ 页 ---$")
+_RE_CN_PAGE = re.compile(r'^第\s*\d+\s*页$')
+_RE_EN_PAGE = re.compile(r'^Page\s*\d+\s*of\s*\d+$')
+
+# 章节标题
+_RE_CHAPTER_BARE = re.compile(r'^第[一二三四五六七八九十百千万零0-9]+章$')
+_RE_CHAPTER_TITLED = re.compile(r'^第[一二三四五六七八九十百千万零0-9]+章[ 　]+')
+_RE_SECTION_CN = re.compile(r'^第[一二三四五六七八九十百千万零0-9]+节[\s　]*')
+_RE_SECTION_NUM = re.compile(r'^([0-9]+\.[0-9.]+)[\s\.．]+(.*)')
+
+# 目录、前言、附录、参考文献（匹配小写文本）
+_RE_TOC = re.compile(r'^(目\s*录|目\s*次|CONTENTS|TABLE OF CONTENTS)$', re.IGNORECASE)
+_RE_PREFACE = re.compile(r'^(前言|序言|引言|致谢|序|preface|introduction|acknowledgement)$')
+_RE_APPENDIX = re.compile(r'^(附录|appendix)[\s　a-zA-Z]*')
+_RE_REFS = re.compile(r'^(参考文献|references)$')
+
+# identify_structure 使用的模式，顺序即匹配优先级
+_STRUCTURE_PATTERNS = [
+    ("toc_header", _RE_TOC),              # 目录
+    ("preface", _RE_PREFACE),             # 前言/序言
+    ("chapter", _RE_CHAPTER_BARE),        # 第X章
+    ("chapter", _RE_CHAPTER_TITLED),      # 第X章 标题
+    ("section", _RE_SECTION_NUM),         # 1.1/1.1.1 格式
+    ("section", _RE_SECTION_CN),          # 第X节
+    ("appendix", _RE_APPENDIX),           # 附录
+    ("references", _RE_REFS),             # 参考文献
+]
+
+# 合并为单个多分支正则，每个分支用命名分组 _<序号> 标记，match.lastgroup 即命中的分支
+_RE_STRUCTURE = re.compile('|'.join(
+    '(?P<_%d>%s)' % (i, '(?i:%s)' % pattern.pattern if pattern.flags & re.IGNORECASE else pattern.pattern)
+    for i, (_, pattern) in enumerate(_STRUCTURE_PATTERNS)
+))
+_STRUCTURE_GROUPS = {'_%d' % i: structure_type for i, (structure_type, _) in enumerate(_STRUCTURE_PATTERNS)}
+
+# 上述模式可能匹配的首字符（含大写），其他字符开头的行一定是正文，无需再进行正则匹配
+_STRUCTURE_FIRST_CHARS = frozenset('目前序引致第附参0123456789ctpiarCTPIAR')
+
+# 作为标题处理、不参与合并的结构类型
+_TITLE_TYPES = frozenset(["preface", "chapter", "section", "appendix", "references"])
+
+# 各结构类型对应的Markdown格式，未列出的类型按正文处理
+_MARKDOWN_FORMATS = {
+    "preface": "# {}\n\n---\n\n",
+    "chapter": "# {}\n\n---\n\n",
+    "section": "## {}\n\n",
+    "appendix": "# {}\n\n---\n\n",
+    "references": "# {}\n\n---\n\n",
+}
+
+# 断句标点，用于判断两行是否应该合并
+_END_PUNCTUATION = frozenset('。！？；：.!?;:')
+_START_PUNCTUATION = _END_PUNCTUATION
+
+# 每个子进程任务提取的页数
+PAGES_PER_TASK = 16
+
 def is_header_footer(text):
     """
-    判断文本是否为页眉或页脚
+    判断文本是否为页眉或页脚，text 应已去除首尾空白
     """
     if not text:
         return True
     
     # 过滤掉纯数字（可能是页码）
-    if text.strip().isdigit():
+    if text.isdigit():
         return True
     
+    # 按首字符分派，只对可能匹配的文本进行正则匹配
+    first_char = text[0]
     
     # 检测页码标记，如 "--- 第 15 页 ---"
-    if re.match(r"^--- 第 \d+ 页 ---$", text.strip()):
+    if first_char == '-' and _RE_PAGE_MARK.match(text):
         return True
     
-    # 过滤掉常见的页眉页脚内容，但避免过滤只包含"页"或"Page of"的实际内容
-    common_header_footer = ['©', '版权所有']
-    
     # 检查是否为页眉页脚的常见模式，而不是仅包含这些词的正文内容
-    if text.strip() == '页' or text.strip() == 'Page':
+    if text == '页' or text == 'Page':
         return True
     
     # 检查组合模式，如"第X页"或"Page X of Y"
-    if re.match(r'^第\s*\d+\s*页$', text.strip()) or re.match(r'^Page\s*\d+\s*of\s*\d+$', text.strip()):
+    if first_char == '第' and _RE_CN_PAGE.match(text):
+        return True
+    if first_char == 'P' and _RE_EN_PAGE.match(text):
         return True
     
-    return any(keyword in text for keyword in common_header_footer)
+    # 过滤掉常见的页眉页脚内容，如版权信息
+    return '©' in text or '版权所有' in text
 
 def should_merge_lines(line1, line2):
     """
@@ -44,13 +106,11 @@ def should_merge_lines(line1, line2):
         return False
     
     # 如果第一行以标点符号结尾，不合并
-    end_punctuation = ['。', '！', '？', '；', '：', '.', '!', '?', ';', ':']
-    if any(line1.endswith(p) for p in end_punctuation):
+    if line1[-1] in _END_PUNCTUATION:
         return False
     
     # 如果第二行以标点符号开头，不合并
-    start_punctuation = ['。', '！', '？', '；', '：', '.', '!', '?', ';', ':']
-    if any(line2.startswith(p) for p in start_punctuation):
+    if line2[0] in _START_PUNCTUATION:
         return False
     
     # 如果两行都是短句，不合并
@@ -67,96 +127,131 @@ def merge_lines(lines):
         return []
     
     merged_lines = []
-    current_line = lines[0]
+    # 用列表缓存待合并的片段，最后一次性 join，避免字符串反复拼接
+    current_parts = [lines[0]]
+    # should_merge_lines 只关心第一行的末尾字符和长度是否小于10，
+    # 因此只需保留已合并内容的最后10个字符用于判断
+    current_tail = lines[0][-10:]
     
     for next_line in lines[1:]:
-        if should_merge_lines(current_line, next_line):
-            current_line += next_line
+        if should_merge_lines(current_tail, next_line):
+            current_parts.append(next_line)
+            current_tail = (current_tail + next_line)[-10:]
         else:
-            merged_lines.append(current_line)
-            current_line = next_line
+            merged_lines.append(''.join(current_parts))
+            current_parts = [next_line]
+            current_tail = next_line[-10:]
     
-    merged_lines.append(current_line)
+    merged_lines.append(''.join(current_parts))
     return merged_lines
 
 
-def is_section_title(line):
+def identify_structure(text):
     """
-    判断是否为章节标题
-    支持以下格式：
-    1. 第X章 标题
-    2. 第X节 标题
+    识别文本的结构，判断是前言、章节标题、小节标题还是正文，text 应已去除首尾空白
     """
-    if not line or not line.strip():
-        return False
-    
-    line = line.strip()
+    # 绝大多数正文行的首字符不可能匹配任何结构，直接返回
+    if text[:1] not in _STRUCTURE_FIRST_CHARS:
+        return "content", text
     
-    # 匹配"第X章"格式
-    if re.match(r'^第[一二三四五六七八九十百千万零0-9]+章$', line):
-        print(f"匹配到章节：{line}")
-        return True
+    # 转小写用于匹配
+    text_lower = text.lower()
     
-    # 匹配"第X章 标题"格式
-    if re.match(r'^第[一二三四五六七八九十百千万零0-9]+章[ ]+', line):
-        print(f"匹配到章节：{line}")
-        return True
+    # 所有结构模式合并为一个正则，按优先级顺序一次匹配
+    match = _RE_STRUCTURE.match(text_lower)
+    if not match:
+        # 默认为正文
+        return "content", text
     
-    # 匹配"第X节 标题"格式
-    if re.match(r'^第[一二三四五六七八九十百千万零0-9]+节[ ]+', line):
-        return True
-    
-    return False
+    structure_type = _STRUCTURE_GROUPS[match.lastgroup]
+    if structure_type == "chapter":
+        print(f"匹配到章节2：{text}")
+    return structure_type, text  # 保留完整标题
 
-def identify_structure(text):
+def format_markdown(structure_type, content):
     """
-    识别文本的结构，判断是前言、章节标题、小节标题还是正文
+    将识别出结构的一行文本格式化为Markdown
     """
-    # 去除空格并转小写用于匹配
-    text_lower = text.lower().strip()
-    
-    # 目录匹配
-    if re.match(r'^(目\s*录|目\s*次|CONTENTS|TABLE OF CONTENTS)$', text_lower, re.IGNORECASE):
-        return "toc_header", text
-    
-    
-    # 前言/序言匹配
-    if re.match(r'^(前言|序言|引言|致谢|序|preface|introduction|acknowledgement)$', text_lower):
-        return "preface", text
-    
-    # 匹配"第X章"格式 
-    chapter_match = re.match(r'^第[一二三四五六七八九十百千万零0-9]+章$', text)
-    if chapter_match:
-        print(f"匹配到章节2：{text}")
-        return "chapter", text  # 保留完整章节名
-    
-    # 章节匹配（第X章/第X章 标题）
-    chapter_match = re.match(r'^第[一二三四五六七八九十百千万零0-9]+章[ 　]+', text)
-    if chapter_match:
-        print(f"匹配到章节2：{text}")
-        return "chapter", text  # 保留完整章节名
-    
-    
-    # 小节匹配（1.1/1.1.1 格式）
-    section_match = re.match(r'^([0-9]+\.[0-9.]+)[\s\.．]+(.*)', text)
-    if section_match:
-        return "section", text
-    
-    # 小节匹配（第X节）
-    section_match2 = re.match(r'^第[一二三四五六七八九十百千万零0-9]+节[\s　]*', text)
-    if section_match2:
-        return "section", text
+    return _MARKDOWN_FORMATS.get(structure_type, "{}\n\n").format(content)
+
+def _iter_raw_lines(raw_path):
+    """
+    逐行读取原始文本文件，去掉行尾换行符
+    """
+    with open(raw_path, 'r', encoding='utf-8') as raw_file:
+        for line in raw_file:
+            yield line.rstrip('\n')
+
+def _merge_content_lines(lines):
+    """
+    合并连续的正文行，并识别合并后每一行的结构，跳过目录
+    """
+    for line in merge_lines(lines):
+        # 合并后的行需要重新识别，例如单独成行的"目录"需要跳过
+        structure_type, content = identify_structure(line)
+        if structure_type in ["toc_header", "toc_item"]:
+            continue
+        yield structure_type, content
+
+def _extract_page_range(args):
+    """
+    提取PDF中一段连续页面的文本，在子进程中执行
     
-    # 附录匹配
-    if re.match(r'^(附录|appendix)[\s　a-zA-Z]*', text_lower):
-        return "appendix", text
+    Args:
+        args (tuple): (PDF文件路径, 起始页索引, 结束页索引)，左闭右开
+    """
+    pdf_path, start, end = args
+    texts = []
+    # 只加载本任务需要的页面（pdfplumber页码从1开始）
+    with pdfplumber.open(pdf_path, pages=range(start + 1, end + 1)) as pdf:
+        for page in pdf.pages:
+            texts.append(page.extract_text())
+            # 提取后立即释放页面的布局缓存，避免内存随页数增长（旧版pdfplumber没有Page.close）
+            if hasattr(page, "close"):
+                page.close()
+            else:
+                page.flush_cache()
+    return texts
+
+def extract_pages(pdf_path):
+    """
+    由多个进程并行提取PDF各页的文本，按页序逐页返回
     
-    # 参考文献匹配
-    if re.match(r'^(参考文献|references)$', text_lower):
-        return "references", text
+    Args:
+        pdf_path (str): PDF文件路径
     
-    # 默认为正文
-    return "content", text
+    Yields:
+        tuple: (页码, 文本)，页码从1开始，无文本的页面文本为None或空字符串
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        total_pages = len(pdf.pages)
+    print(f"开始提取PDF文件：{pdf_path}")
+    print(f"总页数：{total_pages}")
+    
+    # 按页分段，由多个进程并行提取，结果按页序返回
+    page_ranges = [(pdf_path, start, min(start + PAGES_PER_TASK, total_pages))
+                   for start in range(0, total_pages, PAGES_PER_TASK)]
+    max_workers = max(1, min(os.cpu_count() or 1, len(page_ranges)))
+    
+    # 降低进度条刷新频率，页数很多时避免频繁刷新
+    with ProcessPoolExecutor(max_workers=max_workers) as executor, \
+            tqdm(total=total_pages, desc="提取原始文本",
+                 mininterval=0.5, miniters=max(1, total_pages // 200)) as progress:
+        page_num = 0
+        for texts in executor.map(_extract_page_range, page_ranges):
+            for text in texts:
+                page_num += 1
+                yield page_num, text
+            progress.update(len(texts))
+
+def _iter_pdf_lines(pdf_path):
+    """
+    逐页提取PDF文本并逐行返回，分行方式与读取原始文本文件一致
+    """
+    for _, text in extract_pages(pdf_path):
+        if text:
+            for line in io.StringIO(text, newline=None):
+                yield line.rstrip('\n')
 
 def convert_pdf_to_text(pdf_path, output_path=None):
     """
@@ -173,25 +268,26 @@ def convert_pdf_to_text(pdf_path, output_path=None):
     if output_path is None:
         output_path = os.path.splitext(pdf_path)[0] + '.raw'
     
+    # 先写入临时文件，全部成功后再替换，避免中断时留下不完整的.raw文件被下次直接使用
+    temp_path = output_path + '.tmp'
+    replaced = False
     try:
-        # 收集所有文本
-        all_text = []
-        
-        with pdfplumber.open(pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-            print(f"开始提取PDF文件：{pdf_path}")
-            print(f"总页数：{total_pages}")
-            
-            for page_num, page in enumerate(tqdm(pdf.pages, desc="提取原始文本"), 1):
-                text = page.extract_text()
+        # 逐页写入原始文本文件，不在内存中保留全部文本
+        print(f"写入原始文本文件：{output_path}")
+        with open(temp_path, 'w', encoding='utf-8', buffering=1 << 20) as raw_file:
+            first_page = True
+            for page_num, text in extract_pages(pdf_path):
                 if text:
+                    # 页与页之间空一行
+                    if not first_page:
+                        raw_file.write("\n")
+                    first_page = False
                     # 添加页码标记以便于后续处理
-                    all_text.append(f"--- 第 {page_num} 页 ---\n{text}\n")
-        
-        # 写入原始文本文件
-        print(f"写入原始文本文件：{output_path}")
-        with open(output_path, 'w', encoding='utf-8') as raw_file:
-            raw_file.write('\n'.join(all_text))
+                    raw_file.write(f"--- 第 {page_num} 页 ---\n")
+                    raw_file.write(text)
+                    raw_file.write("\n")
+        os.replace(temp_path, output_path)
+        replaced = True
         
         print(f"\n原始文本提取完成！输出文件：{output_path}")
         return True, output_path
@@ -201,6 +297,51 @@ def convert_pdf_to_text(pdf_path, output_path=None):
         import traceback
         traceback.print_exc()
         return False, None
+    
+    finally:
+        # 出错或被中断（如Ctrl-C）时删除写了一半的临时文件
+        if not replaced:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+def structure_lines(lines):
+    """
+    逐行处理原始文本：去除页码标记、过滤页眉页脚、识别结构，并合并连续的正文行（不合并标题）
+    
+    Args:
+        lines (iterable): 原始文本行
+    
+    Yields:
+        tuple: (结构类型, 内容)
+    """
+    content_lines = []
+    for line in lines:
+        # 跳过页码标记行，如 "--- 第 15 页 ---"
+        # 只比较固定的前后缀：正文行在前缀处立即失败，不需要正则；
+        # 也不改用更严格的 _RE_PAGE_MARK，保持原有的过滤范围
+        if line.startswith("--- 第") and line.endswith("页 ---"):
+            continue
+        
+        # 过滤空行和页眉页脚
+        line = line.strip()
+        if not line or is_header_footer(line):
+            continue
+        
+        # 每行只识别一次结构
+        structure_type, content = identify_structure(line)
+        if structure_type in _TITLE_TYPES:
+            # 如果有未处理的正文行，先合并后输出
+            yield from _merge_content_lines(content_lines)
+            content_lines = []
+            # 直接输出标题
+            yield structure_type, content
+        else:
+            content_lines.append(line)
+    
+    # 输出最后一组正文行
+    yield from _merge_content_lines(content_lines)
 
 def convert_raw_to_markdown(raw_path, output_path=None):
     """
@@ -217,110 +358,33 @@ def convert_raw_to_markdown(raw_path, output_path=None):
     if output_path is None:
         output_path = os.path.splitext(raw_path)[0] + '.md'
     
+    # 逐行读取原始文本，不一次性读入整个文件
+    print(f"读取原始文本文件：{raw_path}")
+    return convert_lines_to_markdown(_iter_raw_lines(raw_path), output_path)
+
+def convert_lines_to_markdown(lines, output_path):
+    """
+    将原始文本行转换为Markdown格式并写入文件，边处理边写入，不保存中间结果
+    
+    Args:
+        lines (iterable): 原始文本行
+        output_path (str): 输出文件路径
+    """
+    # 先写入临时文件，全部成功后再替换，失败时不影响已有的输出文件
+    temp_path = output_path + '.tmp'
+    replaced = False
     try:
-        # 读取原始文本
-        print(f"读取原始文本文件：{raw_path}")
-        with open(raw_path, 'r', encoding='utf-8') as raw_file:
-            content = raw_file.read()
-        
-        # 分割成行
-        lines = content.split('\n')
-        all_text_lines = []
-        
-        # 去除页码标记和过滤页眉页脚
-        current_lines = []
-        for line in lines:
-            # 跳过页码标记行            
-            if line.startswith("--- 第") and line.endswith("页 ---"):
-                if current_lines:
-                    all_text_lines.extend(current_lines)
-                    current_lines = []
-                continue
-            
-            # 过滤空行和页眉页脚
-            if line.strip() and not is_header_footer(line.strip()):
-                # 检查是否为章节标题或特殊标题
-                if is_section_title(line.strip()) or identify_structure(line.strip())[0] in ["preface", "chapter", "section", "appendix", "references"]:
-                    # 如果有未处理的行，先添加
-                    if current_lines:
-                        all_text_lines.extend(current_lines)
-                        current_lines = []
-                    # 直接添加标题
-                    all_text_lines.append(line.strip())
-                else:
-                    current_lines.append(line.strip())
-        
-        # 添加最后一组行
-        if current_lines:
-            all_text_lines.extend(current_lines)
-        
-        # 合并行（不合并标题）
         print("处理文本格式...")
-        processed_lines = []
-        i = 0
-        while i < len(all_text_lines):
-            line = all_text_lines[i]
-            
-            # 如果是标题，不合并
-            if is_section_title(line) or identify_structure(line)[0] in ["preface", "chapter", "section", "appendix", "references"]:
-                processed_lines.append(line)
-                i += 1
-            else:
-                # 找出可能需要合并的连续非标题行
-                non_title_lines = [line]
-                j = i + 1
-                while j < len(all_text_lines) and not (is_section_title(all_text_lines[j]) or 
-                      identify_structure(all_text_lines[j])[0] in ["preface", "chapter", "section", "appendix", "references"]):
-                    non_title_lines.append(all_text_lines[j])
-                    j += 1
-                
-                # 合并这些行
-                merged = merge_lines(non_title_lines)
-                processed_lines.extend(merged)
-                i = j
-        
-        # 处理文档结构
-        print("分析文档结构...")
-        structured_content = []
-        
-        for line in processed_lines:
-            # 识别文档结构
-            structure_type, content = identify_structure(line)
-            
-            # 如果是正文内容，直接添加
-            if structure_type == "content":
-                structured_content.append((structure_type, content))
-            # 如果是目录相关，跳过
-            elif structure_type in ["toc_header", "toc_item"]:
-                continue
-            # 其他类型作为标题处理
-            else:
-                structured_content.append((structure_type, content))
-        
-        # 写入Markdown文件
         print(f"写入Markdown文件：{output_path}")
-        with open(output_path, 'w', encoding='utf-8') as md_file:
-            for structure_type, content in structured_content:
-                if structure_type == "preface":
-                    md_file.write(f"# {content}\n\n")
-                    md_file.write("---\n\n")
-                elif structure_type == "chapter":
-                    md_file.write(f"# {content}\n\n")
-                    md_file.write("---\n\n")
-                elif structure_type == "section":
-                    md_file.write(f"## {content}\n\n")
-                elif structure_type == "appendix":
-                    md_file.write(f"# {content}\n\n")
-                    md_file.write("---\n\n")
-                elif structure_type == "references":
-                    md_file.write(f"# {content}\n\n")
-                    md_file.write("---\n\n")
-                else:  # 正文内容
-                    md_file.write(f"{content}\n\n")
+        with open(temp_path, 'w', encoding='utf-8', buffering=1 << 20) as md_file:
+            md_file.writelines(format_markdown(structure_type, content)
+                               for structure_type, content in structure_lines(lines))
             
             # 在文档末尾添加转换信息
             md_file.write("\n\n---\n\n")
             md_file.write("*由PDF2MD自动转换生成*\n")
+        os.replace(temp_path, output_path)
+        replaced = True
         
         print(f"\n转换完成！输出文件：{output_path}")
         return True
@@ -330,8 +394,16 @@ def convert_raw_to_markdown(raw_path, output_path=None):
         import traceback
         traceback.print_exc()
         return False
+    
+    finally:
+        # 出错或被中断（如Ctrl-C）时删除写了一半的临时文件
+        if not replaced:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
 
-def convert_pdf_to_markdown(pdf_path, output_path=None):
+def convert_pdf_to_markdown(pdf_path, output_path=None, keep_raw=True):
     """
     将PDF文件转换为Markdown格式，首先生成原始文本文件，然后基于原始文件生成Markdown
     如果.raw文件已存在，则直接使用该文件进行转换
@@ -339,25 +411,29 @@ def convert_pdf_to_markdown(pdf_path, output_path=None):
     Args:
         pdf_path (str): PDF文件路径
         output_path (str, optional): 输出文件路径，如果不指定则使用PDF文件名
+        keep_raw (bool, optional): 是否生成.raw文件，为False时直接将提取的文本转换为Markdown，不写入原始文本文件
     """
     if not os.path.exists(pdf_path):
         print(f"错误：文件 {pdf_path} 不存在")
         return False
     
-    # 确定输出文件路径
-    if output_path is None:
-        md_output_path = os.path.splitext(pdf_path)[0] + '.md'
-    else:
-        md_output_path = output_path
-    
-    # 确定原始文本文件路径
-    raw_output_path = os.path.splitext(pdf_path)[0] + '.raw'
+    # 确定输出文件和原始文本文件路径
+    stem = os.path.splitext(pdf_path)[0]
+    md_output_path = output_path if output_path is not None else stem + '.md'
+    raw_output_path = stem + '.raw'
     
     # 检查.raw文件是否已存在
     if os.path.exists(raw_output_path):
         print(f"发现已存在的原始文本文件：{raw_output_path}")
         print("将直接使用该文件进行转换...")
         raw_path = raw_output_path
+    elif not keep_raw:
+        # 不需要保留.raw文件，提取的文本直接转换为Markdown
+        success = convert_lines_to_markdown(_iter_pdf_lines(pdf_path), md_output_path)
+        if not success:
+            print("生成Markdown文件失败")
+            return False
+        return True
     else:
         # 如果.raw文件不存在，则从PDF生成
         print(f"未找到原始文本文件，将从PDF生成：{raw_output_path}")
@@ -375,14 +451,19 @@ def convert_pdf_to_markdown(pdf_path, output_path=None):
     return True
 
 def main():
-    if len(sys.argv) < 2:
-        print("使用方法：python pdf2md.py <PDF文件路径> [输出文件路径]")
+    # --no-raw：不生成.raw文件，直接转换
+    args = sys.argv[1:]
+    keep_raw = "--no-raw" not in args
+    args = [arg for arg in args if arg != "--no-raw"]
+    
+    if len(args) < 1:
+        print("使用方法：python pdf2md.py [--no-raw] <PDF文件路径> [输出文件路径]")
         sys.exit(1)
     
-    pdf_path = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else None
+    pdf_path = args[0]
+    output_path = args[1] if len(args) > 1 else None
     
-    convert_pdf_to_markdown(pdf_path, output_path)
+    convert_pdf_to_markdown(pdf_path, output_path, keep_raw=keep_raw)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file